@@ -41,6 +41,33 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {self._config_path}")
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON in configuration file: {self._config_path}")
+        
+        # Resolve derived settings once so callers get plain attribute access
+        self.deepseek_api_key: str = cast(
+            str, self.get('deepseek', 'api_key') or os.environ.get('DEEPSEEK_API_KEY', '')
+        )
+        self.deepseek_api_url: str = cast(
+            str, self.get('deepseek', 'api_url', 'https://api.deepseek.com/chat/completions')
+        )
+        self.deepseek_model: str = cast(str, self.get('deepseek', 'model', 'deepseek-chat'))
+        self.deepseek_rephrase: bool = cast(bool, self.get('deepseek', 'rephrase', False))
+        self.telegram_bot_token: str = cast(
+            str, self.get('telegram', 'bot_token') or os.environ.get('TELEGRAM_BOT_TOKEN', '')
+        )
+        self.telegram_chat_id: str = cast(
+            str, self.get('telegram', 'chat_id') or os.environ.get('TELEGRAM_CHAT_ID', '')
+        )
+        self.nhk_url: str = cast(str, self.get('nhk', 'url', 'https://www.nhk.or.jp/kishou-saigai/'))
+        self.nhk_map_selector: str = cast(
+            str, self.get('nhk', 'map_selector', '.theWeatherForecastWeeklyMap')
+        )
+        self.translations_cache_path: str = cast(str, self.get(
+            'cache',
+            'translations_path',
+            str(Path(__file__).parent.parent.parent / "data" / "city_translations.json")
+        ))
+        self.schedule_hours: int = cast(int, self.get('schedule', 'hours', 16))
+        self.schedule_minutes: int = cast(int, self.get('schedule', 'minutes', 0))
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -63,51 +90,6 @@ class Config:
         :return: Dictionary containing the section configuration.
         """
         return self._config.get(section, {})
-    
-    @property
-    def deepseek_api_key(self) -> str:
-        """Get the DeepSeek API key."""
-        return cast(str, self.get('deepseek', 'api_key') or os.environ.get('DEEPSEEK_API_KEY', ''))
-    
-    @property
-    def deepseek_api_url(self) -> str:
-        """Get the DeepSeek API URL."""
-        return cast(str, self.get('deepseek', 'api_url', 'https://api.deepseek.com/chat/completions'))
-    
-    @property
-    def deepseek_model(self) -> str:
-        """Get the DeepSeek model name."""
-        return cast(str, self.get('deepseek', 'model', 'deepseek-chat'))
-    
-    @property
-    def telegram_bot_token(self) -> str:
-        """Get the Telegram bot token."""
-        return cast(str, self.get('telegram', 'bot_token') or os.environ.get('TELEGRAM_BOT_TOKEN', ''))
-    
-    @property
-    def telegram_chat_id(self) -> str:
-        """Get the Telegram chat ID."""
-        return cast(str, self.get('telegram', 'chat_id') or os.environ.get('TELEGRAM_CHAT_ID', ''))
-    
-    @property
-    def nhk_url(self) -> str:
-        """Get the NHK website URL."""
-        return cast(str, self.get('nhk', 'url', 'https://www.nhk.or.jp/kishou-saigai/'))
-    
-    @property
-    def nhk_map_selector(self) -> str:
-        """Get the CSS selector for the NHK weather map."""
-        return cast(str, self.get('nhk', 'map_selector', '.theWeatherForecastWeeklyMap'))
-    
-    @property
-    def schedule_hours(self) -> int:
-        """Get the scheduled execution hours (UTC)."""
-        return cast(int, self.get('schedule', 'hours', 16))
-    
-    @property
-    def schedule_minutes(self) -> int:
-        """Get the scheduled execution minutes (UTC)."""
-        return cast(int, self.get('schedule', 'minutes', 0))
 
 
 config = Config()
\ No newline at end of file
@@ -4,7 +4,7 @@ Core data models for NHK Japan Weather Parser.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CityWeather:
     """
     Data class for city weather information.
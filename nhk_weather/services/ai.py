@@ -1,17 +1,21 @@
 """
 AI module for interacting with DeepSeek API.
 """
-import json
+import os
 import re
+import sys
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, TypedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, TypedDict
 
-import aiohttp
+import httpx
+import orjson
 from loguru import logger
 
 from nhk_weather.config.config import config
 
 TRANSLATE_SYSTEM_PROMPT = (
+    "На входе — список японских названий, по одному на строку. "
     "Верни ТОЛЬКО валидный JSON {jp: ru}. "
     "ru — это русское название города (кириллица). "
     "Если нет общепринятого названия — транслитерируй на русский по звучанию. "
@@ -22,7 +26,7 @@ WEATHER_SUMMARY_SYSTEM_PROMPT_TEMPLATE = (
     "Ты — лаконичный русскоязычный метео-редактор. "
     "Сегодняшняя дата: {date}. "
     "Используй ТОЛЬКО факты из переданного JSON. Ничего не выдумывай: никаких температур, городов или явлений, которых нет в данных. "
-    "Сделай 1–2 предложения.\n\n"
+    "Сделай 1–2 предложения, МАКСИМУМ 2 ПРЕДЛОЖЕНИЯ для всего прогноза.\n\n"
     "Обязательно:\n"
     "• КРИТИЧЕСКИ ВАЖНО: ВСЕГДА указывай температуру в градусах Цельсия (например, +37°C) для упоминаемых городов. Поле max_c содержит эту информацию.\n"
     "• Упомяни текущую дату в контексте прогноза погоды.\n"
@@ -33,11 +37,16 @@ WEATHER_SUMMARY_SYSTEM_PROMPT_TEMPLATE = (
     "• Добавляй уместные эмодзи (например, 🌧️ для дождя, ☀️ для солнца, 🌩️ для грозы), но не перебарщивай (1-2 эмодзи на весь текст).\n"
     "• Используй тире (—) для выделения важных частей сообщения.\n"
     "• Каждый раз формулируй прогноз по-разному, избегай шаблонных фраз.\n"
+    "• Пиши естественно и профессионально, как опытный редактор метеосводок.\n"
+    "• Используй разнообразные и точные выражения для описания погодных явлений.\n"
     "• Если температура не указана, то не пиши ничего про температуру.\n"
     "Пример формата: \"Сегодня по всей Японии — жара: в Токио и Осаке до +37°C, душно и солнечно. 🌧️ В Саппоро — грозы и дожди, на юге местами возможны кратковременные осадки.\"\n"
     "Формат ответа: чистый текст, без списков и кавычек."
 )
 
+# Japan Standard Time (UTC+9)
+JST = timezone(timedelta(hours=9))
+
 WEATHER_SUMMARY_USER_PROMPT = "Данные по городам (макс. температура в °C и описание погоды в alt):\n"
 
 WEATHER_REPHRASE_SYSTEM_PROMPT = (
@@ -69,6 +78,20 @@ CITY_TRANSLATIONS: Dict[str, str] = {
     "高知": "Коти",
 }
 
+# Intern keys so lookups with interned scraped names short-circuit on identity
+CITY_TRANSLATIONS = {sys.intern(k): v for k, v in CITY_TRANSLATIONS.items()}
+
+
+@lru_cache(maxsize=2)
+def _summary_system_prompt(date: str) -> str:
+    """
+    Render the weather summary system prompt for the given date.
+    
+    :param date: Current date in YYYY-MM-DD format.
+    :return: Formatted system prompt.
+    """
+    return WEATHER_SUMMARY_SYSTEM_PROMPT_TEMPLATE.format(date=date)
+
 
 class MessageDict(TypedDict):
     """Type definition for a message in the DeepSeek API."""
@@ -98,6 +121,66 @@ class DeepSeekClient:
         self._api_url: str = config.deepseek_api_url
         self._model: str = config.deepseek_model
         self._cyrillic_re = re.compile(r"[А-ЯЁа-яё]")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._translations_path: str = config.translations_cache_path
+        self._load_translations()
+
+    def _load_translations(self) -> None:
+        """
+        Merge previously learned city translations from the cache file.
+        
+        Hardcoded translations take precedence over cached ones.
+        """
+        try:
+            with open(self._translations_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Failed to load translations cache {self._translations_path}: {e}")
+            return
+
+        if not isinstance(cached, dict):
+            logger.warning(f"Ignoring translations cache {self._translations_path}: expected a JSON object")
+            return
+
+        loaded = 0
+        for jp, ru in cached.items():
+            if isinstance(jp, str) and isinstance(ru, str) and jp and ru:
+                CITY_TRANSLATIONS.setdefault(sys.intern(jp), ru)
+                loaded += 1
+        logger.debug(f"Loaded {loaded} cached city translations")
+
+    def _save_translations(self) -> None:
+        """
+        Atomically write the known city translations to the cache file.
+        """
+        tmp_path = f"{self._translations_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._translations_path) or ".", exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(CITY_TRANSLATIONS, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self._translations_path)
+        except OSError as e:
+            logger.warning(f"Failed to save translations cache {self._translations_path}: {e}")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the shared HTTP/2 client.
+        
+        :return: Httpx AsyncClient instance.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=60,
+                limits=httpx.Limits(max_connections=4),
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+        return self._client
 
     async def chat(self, messages: List[MessageDict], temperature: float = 0.2) -> str:
         """
@@ -118,27 +201,37 @@ class DeepSeekClient:
             "temperature": temperature
         }
 
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json"
-        }
+        client = self._get_client()
+        try:
+            response = await client.post(self._api_url, content=orjson.dumps(payload))
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"DeepSeek API request failed: {str(e)}")
+
+        if response.status_code != 200:
+            raise RuntimeError(f"DeepSeek API error: {response.status_code} - {response.text}")
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                        self._api_url,
-                        headers=headers,
-                        json=payload,
-                        timeout=60
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise RuntimeError(f"DeepSeek API error: {response.status} - {error_text}")
-
-                    data = await response.json()
-                    return data["choices"][0]["message"]["content"].strip()
-            except aiohttp.ClientError as e:
-                raise RuntimeError(f"DeepSeek API request failed: {str(e)}")
+        try:
+            data = orjson.loads(response.content)
+            return data["choices"][0]["message"]["content"].strip()
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError) as e:
+            raise RuntimeError(f"DeepSeek API returned an invalid response: {str(e)}")
+
+    def _split_translations(self, data: Dict[str, Any]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Split translated terms into valid Cyrillic translations and failed terms.
+        
+        :param data: Dictionary mapping Japanese terms to translations from the API.
+        :return: Tuple of (valid translations, terms that need another attempt).
+        """
+        search = self._cyrillic_re.search
+        good: Dict[str, str] = {}
+        bad: List[str] = []
+        for jp, ru in data.items():
+            if ru and search(ru):
+                good[jp] = ru.strip()
+            else:
+                bad.append(jp)
+        return good, bad
 
     async def translate(self, jp_terms: List[str], max_retries: int = 2) -> Dict[str, str]:
         """
@@ -148,9 +241,19 @@ class DeepSeekClient:
         :param max_retries: Maximum number of retry attempts.
         :return: Dictionary mapping Japanese terms to Russian translations.
         """
-        to_do = [t for t in jp_terms if t and t not in CITY_TRANSLATIONS]
+        known: Dict[str, str] = {}
+        to_do: List[str] = []
+        for t in jp_terms:
+            ru = CITY_TRANSLATIONS.get(t)
+            if ru is not None:
+                known[t] = ru
+            elif t:
+                to_do.append(t)
+            else:
+                known[t] = t
+
         if not to_do:
-            return {t: CITY_TRANSLATIONS.get(t, t) for t in jp_terms}
+            return known
 
         attempt = 0
         missing = to_do[:]
@@ -164,31 +267,32 @@ class DeepSeekClient:
                 "role": "system",
                 "content": TRANSLATE_SYSTEM_PROMPT
             }
-            user: MessageDict = {"role": "user", "content": json.dumps(missing, ensure_ascii=False)}
+            user: MessageDict = {"role": "user", "content": "\n".join(missing)}
 
             resp = await self.chat([system, user], temperature=0.0)
 
             start, end = resp.find("{"), resp.rfind("}")
             if start >= 0 and end > start:
                 try:
-                    data = json.loads(resp[start:end + 1])
+                    data = orjson.loads(resp[start:end + 1])
+
+                    good, _ = self._split_translations(data)
 
-                    good, bad = {}, []
-                    for jp, ru in data.items():
-                        if ru and self._cyrillic_re.search(ru):
-                            good[jp] = ru.strip()
-                        else:
-                            bad.append(jp)
+                    # Only cache translations for terms that were actually requested
+                    requested = set(missing)
+                    good = {jp: ru for jp, ru in good.items() if jp in requested}
 
                     result.update(good)
-                    missing = bad
-                    logger.debug(f"good={len(good)}, bad={len(bad)}")
-                except json.JSONDecodeError:
+                    missing = [t for t in missing if t not in good]
+                    logger.debug(f"good={len(good)}, bad={len(missing)}")
+                except orjson.JSONDecodeError:
                     logger.error(f"Failed to parse JSON from response: {resp}")
             else:
                 logger.error(f"No JSON found in response: {resp}")
 
-        CITY_TRANSLATIONS.update(result)
+        if result:
+            CITY_TRANSLATIONS.update(result)
+            self._save_translations()
 
         for jp in missing:
             result[jp] = jp
@@ -213,20 +317,18 @@ class DeepSeekClient:
         ]
         
         # Debug log to check temperature data
-        logger.debug(f"Weather payload for AI: {json.dumps(payload, ensure_ascii=False)}")
+        logger.debug(f"Weather payload for AI: {orjson.dumps(payload).decode()}")
 
-        # Use UTC+9 timezone (Japan Standard Time)
-        jst = timezone(timedelta(hours=9))
-        current_date = datetime.now(jst).strftime("%Y-%m-%d")
+        current_date = datetime.now(JST).strftime("%Y-%m-%d")
 
         system: MessageDict = {
             "role": "system",
-            "content": WEATHER_SUMMARY_SYSTEM_PROMPT_TEMPLATE.format(date=current_date)
+            "content": _summary_system_prompt(current_date)
         }
 
         user: MessageDict = {
             "role": "user",
-            "content": WEATHER_SUMMARY_USER_PROMPT + json.dumps(payload, ensure_ascii=False, indent=2)
+            "content": WEATHER_SUMMARY_USER_PROMPT + orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
         }
 
         return await self.chat([system, user], temperature=0.7)
@@ -259,5 +361,20 @@ class DeepSeekClient:
         
         return rephrased
 
+    async def close(self) -> None:
+        """
+        Close the HTTP client.
+        """
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
 
-deepseek_client = DeepSeekClient()
+@lru_cache(maxsize=1)
+def get_deepseek_client() -> DeepSeekClient:
+    """
+    Get the shared DeepSeek client instance.
+    
+    :return: DeepSeekClient instance, created on first call.
+    """
+    return DeepSeekClient()
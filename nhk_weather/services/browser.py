@@ -2,15 +2,30 @@
 Browser module for web scraping and screenshot capture.
 """
 import asyncio
-import re
-from typing import Dict, List, Any, Tuple
+import sys
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
-from playwright.async_api import async_playwright, ViewportSize
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Playwright,
+    ViewportSize,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from loguru import logger
 
 from nhk_weather.config.config import config
 from nhk_weather.core.models import CityWeather
 
+# Chromium flags for a lightweight headless run inside a container
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+]
+
 # JavaScript for scraping weather data
 WEATHER_SCRAPE_JS = """
 () => Array.from(document.querySelectorAll('.weather-forecast-plate')).map(n => ({
@@ -20,6 +35,13 @@ WEATHER_SCRAPE_JS = """
 }))
 """
 
+# JavaScript predicate: the forecast tiles have rendered temperatures and loaded icons
+WEATHER_READY_JS = """
+() => document.querySelectorAll('.weather-forecast-plate .max-temp').length >= 10
+    && Array.from(document.querySelectorAll('.weather-forecast-plate .max-temp')).every(e => e.textContent.trim().length > 0)
+    && Array.from(document.querySelectorAll('.weather-telop-icon img')).every(i => i.complete)
+"""
+
 # JavaScript for replacing city names
 REPLACE_CITY_NAMES_JS = """
 (dict) => {
@@ -42,11 +64,24 @@ REPLACE_CITY_NAMES_JS = """
     cont.__ruObserver = obs;
   }
   
-  const names = Array.from(document.querySelectorAll('.weather-forecast-name')).map(e=>e.textContent.trim());
-  return names;
+  return window.__hasCyrillicNames();
 }
 """
 
+# JavaScript init script defining a Cyrillic city name check once per page
+CYRILLIC_CHECK_INIT_JS = """
+window.__CYR = /[А-ЯЁа-яё]/;
+window.__hasCyrillicNames = () => {
+  for (const e of document.querySelectorAll('.weather-forecast-name')) {
+    if (window.__CYR.test(e.textContent)) return true;
+  }
+  return false;
+};
+"""
+
+# JavaScript predicate: at least one city name is in Cyrillic
+HAS_CYRILLIC_NAMES_JS = "() => window.__hasCyrillicNames()"
+
 # CSS styles for the weather map
 WEATHER_MAP_CSS = """
 @import url('https://fonts.googleapis.com/css2?family=Inter:wght@600&display=swap');
@@ -74,7 +109,9 @@ class BrowserScraper:
         """Initialize the browser scraper."""
         self._url: str = config.nhk_url
         self._map_selector: str = config.nhk_map_selector
-        self._cyrillic_re = re.compile(r"[А-ЯЁа-яё]")
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
     
     async def scrape_weather_data(self, page: Any) -> List[Dict[str, str]]:
         """
@@ -93,18 +130,14 @@ class BrowserScraper:
         :param mapping: Dictionary mapping Japanese names to Russian translations.
         :return: True if at least one Cyrillic name is present.
         """
-        names = await page.evaluate(REPLACE_CITY_NAMES_JS, mapping)
-        ok = any(self._cyrillic_re.search(n) for n in names)
+        ok = await page.evaluate(REPLACE_CITY_NAMES_JS, mapping)
         
         if not ok:
-            for i in range(3):
-                await asyncio.sleep(0.3)
-                names = await page.evaluate(
-                    "() => Array.from(document.querySelectorAll('.weather-forecast-name')).map(e=>e.textContent.trim())"
-                )
-                if any(self._cyrillic_re.search(n) for n in names):
-                    ok = True
-                    break
+            try:
+                await page.wait_for_function(HAS_CYRILLIC_NAMES_JS, timeout=2_000)
+                ok = True
+            except PlaywrightTimeoutError:
+                logger.warning("Cyrillic city names did not appear in the DOM")
         
         return ok
     
@@ -123,47 +156,73 @@ class BrowserScraper:
         :param page: Browser page object.
         :return: Screenshot as bytes.
         """
-        screenshot_bytes = await page.locator(self._map_selector).screenshot()
+        screenshot_bytes = await page.locator(self._map_selector).screenshot(type="jpeg", quality=85)
         logger.info("Screenshot captured successfully")
         return screenshot_bytes
     
-    async def process(self, translate_func: Any) -> Tuple[List[CityWeather], bytes]:
+    async def start(self) -> BrowserContext:
+        """
+        Launch the browser and create a reusable context.
+        
+        Reuses the running browser if it is still connected.
+        
+        :return: Shared browser context.
+        """
+        if self._context is not None and self._browser is not None and self._browser.is_connected():
+            return self._context
+        
+        await self.close()
+        
+        logger.info("Opening browser")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=True,
+            chromium_sandbox=False,
+            args=CHROMIUM_ARGS
+        )
+        self._context = await self._browser.new_context(
+            viewport=ViewportSize(width=1600, height=1200)
+        )
+        await self._context.add_init_script(CYRILLIC_CHECK_INIT_JS)
+        return self._context
+    
+    async def scrape_once(self, translate_func: Any) -> Tuple[List[CityWeather], bytes]:
         """
-        Process the NHK weather page.
+        Process the NHK weather page in a fresh page of the shared browser context.
         
         :param translate_func: Function to translate Japanese to Russian.
         :return: Tuple of (weather data list, screenshot bytes).
         """
-        logger.info("Opening browser")
-        async with async_playwright() as playwright:
-            browser = await playwright.firefox.launch(headless=True)
-            context = await browser.new_context(
-                viewport=ViewportSize(width=1600, height=1200)
-            )
-            page = await context.new_page()
-            
+        context = await self.start()
+        page = await context.new_page()
+        try:
             await page.goto(self._url)
             await page.wait_for_selector(self._map_selector, timeout=30_000)
             
-            await asyncio.sleep(10)
+            try:
+                await page.wait_for_function(WEATHER_READY_JS, timeout=15_000)
+            except PlaywrightTimeoutError:
+                logger.warning("Weather tiles did not finish rendering in time, continuing")
             
             raw_data = await self.scrape_weather_data(page)
             logger.info(f"Found {len(raw_data)} weather tiles")
             if not raw_data:
                 raise RuntimeError('No weather tiles found')
             
-            jp_names = [r["name"] for r in raw_data if r["name"]]
-            mapping = await translate_func(jp_names)
+            jp_names = [sys.intern(r["name"]) for r in raw_data if r["name"]]
+            mapping, _ = await asyncio.gather(
+                translate_func(jp_names),
+                self.apply_styles(page)
+            )
             logger.debug(f"Translation mapping: {mapping}")
             
             logger.info("Replacing names in DOM...")
             dom_ok = await self.replace_city_names(page, mapping)
             logger.info(f"DOM Cyrillic status: {dom_ok}")
             
-            await self.apply_styles(page)
-            
             screenshot = await self.capture_screenshot(page)
-            await browser.close()
+        finally:
+            await page.close()
         
         weather_data = [
             CityWeather(
@@ -176,6 +235,33 @@ class BrowserScraper:
         ]
         
         return weather_data, screenshot
+    
+    async def close(self) -> None:
+        """
+        Close the browser context, the browser and the Playwright driver.
+        """
+        if self._context:
+            try:
+                await self._context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close browser context: {e}")
+            self._context = None
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Failed to close browser: {e}")
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
 
-browser_scraper = BrowserScraper()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_browser_scraper() -> BrowserScraper:
+    """
+    Get the shared browser scraper instance.
+    
+    :return: BrowserScraper instance, created on first call.
+    """
+    return BrowserScraper()
\ No newline at end of file
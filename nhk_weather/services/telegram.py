@@ -1,14 +1,23 @@
 """
 Telegram module for sending messages and images to Telegram channels.
 """
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-from aiogram import Bot
-from aiogram.types import BufferedInputFile
 from loguru import logger
 
 from nhk_weather.config.config import config
 
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+# Maximum photo caption length allowed by the Telegram Bot API
+CAPTION_LIMIT = 1024
+
+# Sentence-ending punctuation, only when followed by whitespace or the end of text
+SENTENCE_END_RE = re.compile(r"[.!?…](?=\s|$)")
+
 
 class TelegramClient:
     """
@@ -25,7 +34,7 @@ class TelegramClient:
         """
         self._bot_token: str = config.telegram_bot_token
         self._chat_id: str = config.telegram_chat_id
-        self._bot: Optional[Bot] = None
+        self._bot: Optional["Bot"] = None
         
         if not self._bot_token:
             raise ValueError("Telegram bot token is not set")
@@ -33,13 +42,15 @@ class TelegramClient:
         if not self._chat_id:
             raise ValueError("Telegram chat ID is not set")
     
-    async def _get_bot(self) -> Bot:
+    async def _get_bot(self) -> "Bot":
         """
         Get or create the Bot instance.
         
         :return: Aiogram Bot instance.
         """
         if self._bot is None:
+            from aiogram import Bot
+            
             self._bot = Bot(token=self._bot_token)
         return self._bot
     
@@ -84,9 +95,11 @@ class TelegramClient:
         
         chat_id = chat_id or self._chat_id
         
+        from aiogram.types import BufferedInputFile
+        
         try:
             bot = await self._get_bot()
-            input_file = BufferedInputFile(photo_bytes, filename="weather_map.png")
+            input_file = BufferedInputFile(photo_bytes, filename="weather_map.jpg")
             await bot.send_photo(chat_id=chat_id, photo=input_file, caption=caption)
             logger.info(f"Photo sent to chat {chat_id}")
             return True
@@ -94,6 +107,29 @@ class TelegramClient:
             logger.error(f"Failed to send photo: {str(e)}")
             return False
     
+    @staticmethod
+    def _truncate_caption(text: str, limit: int = CAPTION_LIMIT) -> str:
+        """
+        Shorten text to fit into a photo caption, preferring a sentence boundary.
+        
+        :param text: Caption text.
+        :param limit: Maximum caption length.
+        :return: Text of at most ``limit`` characters.
+        """
+        if len(text) <= limit:
+            return text
+        
+        cut = text[:limit]
+        end = 0
+        for match in SENTENCE_END_RE.finditer(text, 0, limit + 1):
+            if match.end() <= limit:
+                end = match.end()
+        if end > 0:
+            return cut[:end]
+        
+        space = cut.rfind(" ", 0, limit - 1)
+        return (cut[:space] if space > 0 else cut[:limit - 1]) + "…"
+    
     async def send_weather_report(self, summary: str, photo_bytes: bytes) -> bool:
         """
         Send a complete weather report with text and image.
@@ -103,15 +139,11 @@ class TelegramClient:
         :return: True if both the message and photo were sent successfully, False otherwise.
         """
         try:
-            result = await self.send_photo(photo_bytes=photo_bytes, caption=summary)
-            
-            if not result and summary:
-                logger.info("Caption might be too long, sending as separate message")
-                await self.send_photo(photo_bytes=photo_bytes)
-                await self.send_message(text=summary)
-                result = True
+            if summary and len(summary) > CAPTION_LIMIT:
+                logger.info(f"Summary exceeds {CAPTION_LIMIT} characters, shortening caption")
+                summary = self._truncate_caption(summary)
             
-            return result
+            return await self.send_photo(photo_bytes=photo_bytes, caption=summary)
         except Exception as e:
             logger.error(f"Failed to send weather report: {str(e)}")
             return False
@@ -125,4 +157,11 @@ class TelegramClient:
             self._bot = None
 
 
-telegram_client = TelegramClient()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_telegram_client() -> TelegramClient:
+    """
+    Get the shared Telegram client instance.
+    
+    :return: TelegramClient instance, created on first call.
+    """
+    return TelegramClient()
\ No newline at end of file
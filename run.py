@@ -4,17 +4,32 @@ NHK Japan Weather Parser
 Entry point script for the application.
 """
 import asyncio
+import signal
 import sys
-import time
 from datetime import datetime, UTC
 
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from nhk_weather.config.config import config
 from nhk_weather.core.models import CityWeather
-from nhk_weather.services.ai import deepseek_client
-from nhk_weather.services.browser import browser_scraper
-from nhk_weather.services.telegram import telegram_client
+
+# Weather categories as (alt substring, label) pairs, checked in priority order
+WEATHER_CATEGORIES: tuple[tuple[str, str], ...] = (
+    ("雷", "гроза"),
+    ("雪", "снег"),
+    ("晴れ時々くもり", "солнечно, временами облачно"),
+    ("くもり時々雨", "облачно, временами дождь"),
+    ("雨時々やむ", "дождь с прояснениями"),
+    ("雨", "дождь"),
+    ("晴", "солнечно"),
+    ("くも", "облачно"),
+    ("曇", "облачно"),
+)
 
 
 class WeatherReporter:
@@ -25,37 +40,35 @@ class WeatherReporter:
     """
     
     def __init__(self) -> None:
-        """Initialize the weather reporter."""
-        self._ai_client = deepseek_client
-        self._browser = browser_scraper
-        self._telegram = telegram_client
+        """
+        Initialize the weather reporter.
+        
+        Service modules are imported here rather than at module level, so
+        importing run.py alone does not load httpx or playwright. aiogram is
+        deferred further and only imported when the Telegram bot is created.
+        """
+        from nhk_weather.services.ai import get_deepseek_client
+        from nhk_weather.services.browser import get_browser_scraper
+        from nhk_weather.services.telegram import get_telegram_client
+        
+        self._ai_client = get_deepseek_client()
+        self._browser = get_browser_scraper()
+        self._telegram = get_telegram_client()
     
-    async def _categorize_weather(self, alt: str) -> str:
+    @staticmethod
+    def _categorize_weather(alt: str) -> str:
         """
         Categorize weather condition based on alt text.
         
         :param alt: Weather condition alt text.
         :return: Categorized weather condition.
         """
-        if "雷" in alt:
-            return "гроза"
-        if "雪" in alt:
-            return "снег"
-        if "晴れ時々くもり" in alt:
-            return "солнечно, временами облачно"
-        if "くもり時々雨" in alt:
-            return "облачно, временами дождь"
-        if "雨時々やむ" in alt:
-            return "дождь с прояснениями"
-        if "雨" in alt:
-            return "дождь"
-        if "晴" in alt:
-            return "солнечно"
-        if "くも" in alt or "曇" in alt:
-            return "облачно"
+        for needle, label in WEATHER_CATEGORIES:
+            if needle in alt:
+                return label
         return alt
 
-    async def _prepare_weather_data(self, weather_data: list[CityWeather]) -> list[dict[str, str]]:
+    def _prepare_weather_data(self, weather_data: list[CityWeather]) -> list[dict[str, str]]:
         """
         Prepare weather data for summary generation.
         
@@ -68,11 +81,31 @@ class WeatherReporter:
                 "ru": record.ru,
                 "max_c": record.max_c,
                 "alt": record.alt,
-                "condition": await self._categorize_weather(record.alt)
+                "condition": self._categorize_weather(record.alt)
             }
             for record in weather_data
         ]
     
+    async def _rephrase_summary(self, summary: str) -> str:
+        """
+        Rephrase a summary, falling back to the original text on failure.
+        
+        :param summary: Initial weather summary text.
+        :return: Rephrased summary, or the initial one if rephrasing failed.
+        """
+        try:
+            rephrased = await self._ai_client.rephrase_weather_summary(summary)
+        except Exception as e:
+            logger.error(f"Failed to rephrase summary, using initial one: {e}")
+            return summary
+        
+        if not rephrased:
+            logger.warning("Empty rephrased summary, using initial one")
+            return summary
+        
+        logger.success(f"Rephrased summary: {rephrased}")
+        return rephrased
+    
     async def run(self) -> bool:
         """
         Run the complete weather reporting workflow.
@@ -80,7 +113,7 @@ class WeatherReporter:
         :return: True if successful, False otherwise.
         """
         try:
-            weather_data, screenshot = await self._browser.process(
+            weather_data, screenshot = await self._browser.scrape_once(
                 self._ai_client.translate
             )
             
@@ -88,29 +121,42 @@ class WeatherReporter:
                 logger.error("No weather data found")
                 return False
             
-            processed_data = await self._prepare_weather_data(weather_data)
+            processed_data = self._prepare_weather_data(weather_data)
 
             initial_summary = await self._ai_client.build_weather_summary(processed_data)
+            
+            if not config.deepseek_rephrase:
+                logger.success(f"Generated summary: {initial_summary}")
+                return await self._telegram.send_weather_report(initial_summary, screenshot)
+            
             logger.info(f"Generated initial summary: {initial_summary}")
             
-            summary = await self._ai_client.rephrase_weather_summary(initial_summary)
-            logger.success(f"Rephrased summary: {summary}")
+            photo_sent, summary = await asyncio.gather(
+                self._telegram.send_photo(photo_bytes=screenshot),
+                self._rephrase_summary(initial_summary)
+            )
             
-            result = await self._telegram.send_weather_report(summary, screenshot)
+            message_sent = await self._telegram.send_message(text=summary)
             
-            return result
+            return photo_sent and message_sent
         except Exception as e:
             logger.exception(f"Error in weather reporting workflow: {e}")
             return False
         finally:
+            await self._ai_client.close()
             await self._telegram.close()
+    
+    async def close(self) -> None:
+        """Release long-lived resources shared between runs."""
+        await self._browser.close()
 
 
-async def run_weather_report() -> None:
+async def run_weather_report(reporter: WeatherReporter) -> None:
     """
     Run the weather reporting workflow once.
+    
+    :param reporter: Weather reporter holding the shared browser.
     """
-    reporter = WeatherReporter()
     success = await reporter.run()
     
     if success:
@@ -130,28 +176,47 @@ async def main() -> None:
     logger.info("Starting NHK Weather Parser with time-based execution")
     logger.info(f"Will run daily at {hours}:{minutes:02d} UTC (configured in config.json)")
     
-    while True:
-        now = datetime.now(tz=UTC)
-        
-        if now.hour == hours and now.minute == minutes:
-            logger.info(f"It's {now.hour}:{now.minute}, running weather report")
-            await run_weather_report()
-            
-            logger.info("Sleeping for 60 seconds to avoid duplicate runs")
-            time.sleep(65)
-        else:
-            if minutes % 10 == 0:
-                logger.debug(f"Current time: {now.hour}:{now.minute}, not yet {hours}:{minutes}")
+    main_task = asyncio.current_task()
+    if main_task is not None:
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+        except NotImplementedError:
+            # Not supported by the Windows event loop; Ctrl+C still reaches the cleanup below
+            logger.debug("SIGTERM handler is not supported on this platform, skipping")
+    
+    reporter = WeatherReporter()
+    
+    try:
+        while True:
+            now = datetime.now(tz=UTC)
             
-            time.sleep(10)
+            if now.hour == hours and now.minute == minutes:
+                logger.info(f"It's {now.hour}:{now.minute}, running weather report")
+                await run_weather_report(reporter)
+                
+                logger.info("Sleeping for 60 seconds to avoid duplicate runs")
+                await asyncio.sleep(65)
+            else:
+                if minutes % 10 == 0:
+                    logger.debug(f"Current time: {now.hour}:{now.minute}, not yet {hours}:{minutes}")
+                
+                await asyncio.sleep(10)
+    finally:
+        await reporter.close()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
         sys.exit(0)
+    except asyncio.CancelledError:
+        logger.info("Process terminated")
+        sys.exit(0)
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         sys.exit(1)
\ No newline at end of file